@@ -5,13 +5,15 @@ from PIL.Image import Image as PILImage
 from locale import getpreferredencoding
 from contextlib import contextmanager
 from src.tree.service import Tree
-from fuzzywuzzy import process
+from rapidfuzz import process, utils
 from typing import Optional
 from psutil import Process
 from time import sleep
 from io import BytesIO
 from PIL import Image
+import win32com.client
 import win32process
+import pythoncom
 import subprocess
 import pyautogui
 import win32con
@@ -25,6 +27,7 @@ class Desktop:
         ctypes.windll.shcore.SetProcessDpiAwareness(PROCESS_PER_MONITOR_DPI_AWARE)
         self.encoding=getpreferredencoding()
         self.desktop_state=None
+        self.start_menu_apps:dict[str,str]={}
         
     def get_state(self,use_vision:bool=False)->DesktopState:
         tree=Tree(self)
@@ -73,7 +76,27 @@ class Desktop:
     def get_element_under_cursor(self)->Control:
         return ControlFromCursor()
     
+    def get_apps_from_apps_folder(self)->dict[str,str]:
+        # Enumerate the AppsFolder namespace in-process, the same source Get-StartApps reads
+        apps_folder=win32com.client.Dispatch('Shell.Application').NameSpace('shell:AppsFolder')
+        return {item.Name.lower():item.Path for item in apps_folder.Items()}
+
     def get_apps_from_start_menu(self)->dict[str,str]:
+        apps_map={}
+        try:
+            pythoncom.CoInitialize()
+        except pythoncom.com_error:
+            pass # e.g. RPC_E_CHANGED_MODE, fall back to Get-StartApps below
+        else:
+            try:
+                # COM objects stay local to the helper so they are released before CoUninitialize
+                apps_map=self.get_apps_from_apps_folder()
+            except Exception:
+                pass # Fall back to Get-StartApps below
+            finally:
+                pythoncom.CoUninitialize()
+        if apps_map:
+            return apps_map
         command='Get-StartApps | ConvertTo-Csv -NoTypeInformation'
         apps_info,_=self.execute_command(command)
         reader=csv.DictReader(io.StringIO(apps_info))
@@ -86,7 +109,8 @@ class Desktop:
                 capture_output=True, 
                 errors='ignore',
                 timeout=25,
-                cwd=os.path.expanduser(path='~')
+                cwd=os.path.expanduser(path='~'),
+                creationflags=subprocess.CREATE_NO_WINDOW
             )
             stdout=result.stdout
             stderr=result.stderr
@@ -101,6 +125,14 @@ class Desktop:
         return process.name() in BROWSER_NAMES
     
     def get_default_language(self)->str:
+        LOCALE_NAME_MAX_LENGTH=85
+        LOCALE_SLOCALIZEDDISPLAYNAME=0x00000002
+        kernel32=ctypes.windll.kernel32
+        locale_name=ctypes.create_unicode_buffer(LOCALE_NAME_MAX_LENGTH)
+        display_name=ctypes.create_unicode_buffer(256)
+        # Same culture Get-Culture reports, without spawning PowerShell
+        if kernel32.GetUserDefaultLocaleName(locale_name,LOCALE_NAME_MAX_LENGTH) and kernel32.GetLocaleInfoEx(locale_name,LOCALE_SLOCALIZEDDISPLAYNAME,display_name,len(display_name)):
+            return display_name.value
         command="Get-Culture | Select-Object Name,DisplayName | ConvertTo-Csv -NoTypeInformation"
         response,_=self.execute_command(command)
         reader=csv.DictReader(io.StringIO(response))
@@ -134,30 +166,50 @@ class Desktop:
         if self.desktop_state is None:
             self.get_state()
         apps = {app.name: app for app in [self.desktop_state.active_app] + self.desktop_state.apps if app is not None}
-        return process.extractOne(name, list(apps.keys()), score_cutoff=60) is not None
+        return process.extractOne(name, list(apps.keys()), processor=utils.default_process, score_cutoff=60) is not None
 
-    def launch_app(self,name:str)->tuple[str,int]:
-        apps_map=self.get_apps_from_start_menu()
-        matched_app=process.extractOne(name,apps_map.keys(),score_cutoff=70)
+    def find_start_menu_app(self,name:str)->str|None:
+        self.start_menu_apps=self.get_apps_from_start_menu()
+        app_name=name.lower()
+        # An exact name needs no fuzzy scoring
+        if app_name in self.start_menu_apps:
+            return app_name
+        matched_app=process.extractOne(name,self.start_menu_apps.keys(),processor=utils.default_process,score_cutoff=70)
         if matched_app is None:
+            return None
+        app_name,_,_=matched_app
+        return app_name
+
+    def launch_app(self,name:str)->tuple[str,int]:
+        def get_target(app_name:str)->str:
+            appid=self.start_menu_apps.get(app_name)
+            return appid if name.endswith('.exe') else f'shell:AppsFolder\\{appid}'
+
+        app_name=name.lower()
+        # Only exact hits are served from the cached index, so a fresh install is never shadowed by a stale near-match
+        if app_name in self.start_menu_apps:
+            try:
+                os.startfile(get_target(app_name))
+                return (f'Launched {app_name.title()}.',0)
+            except OSError:
+                pass # The cached entry may belong to an uninstalled app, so rescan below
+        app_name=self.find_start_menu_app(name)
+        if app_name is None:
             return (f'{name.title()} not found in start menu.',1)
-        app_name,_=matched_app
-        appid=apps_map.get(app_name)
-        if appid is None:
-            return (name,f'{name.title()} not found in start menu.',1)
-        if name.endswith('.exe'):
-            response,status=self.execute_command(f'Start-Process {appid}')
-        else:
-            response,status=self.execute_command(f'Start-Process shell:AppsFolder\\{appid}')
-        return response,status
+        target=get_target(app_name)
+        try:
+            os.startfile(target)
+        except OSError:
+            return self.execute_command(f'Start-Process {target}')
+        return (f'Launched {app_name.title()}.',0)
     
     def switch_app(self,name:str='',handle:int=None):
         apps={app.name:app for app in [self.desktop_state.active_app]+self.desktop_state.apps if app is not None}
         if not handle:
-            matched_app:Optional[tuple[str,float]]=process.extractOne(name,list(apps.keys()),score_cutoff=70)
+            matched_app:Optional[tuple[str,float,int]]=process.extractOne(name,list(apps.keys()),processor=utils.default_process,score_cutoff=70)
             if matched_app is None:
                 return (f'Application {name.title()} not found.',1)
-            app_name,_=matched_app
+            app_name,_,_=matched_app
             app=apps.get(app_name)
             target_handle=app.handle
         else: